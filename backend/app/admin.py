@@ -1,4 +1,6 @@
 from sqladmin import ModelView
+from sqlalchemy import select
+from sqlalchemy.orm import load_only, selectinload
 
 from .models import Comment, Post, User
 
@@ -45,6 +47,14 @@ class PostAdmin(ModelView, model=Post):
         Post.created_at: lambda m, a: m.created_at.strftime("%Y-%m-%d %H:%M:%S"),
     }
 
+    def list_query(self, request):
+        # sqladmin already selectinloads every relation in column_list;
+        # this override only narrows the owner load to the two columns
+        # the formatters actually display.
+        return select(Post).options(
+            selectinload(Post.owner).options(load_only(User.email, User.full_name))
+        )
+
     icon = "fa-solid fa-file-lines"
 
 
@@ -65,4 +75,12 @@ class CommentAdmin(ModelView, model=Comment):
         Comment.post: lambda m, a: f"📝 {m.post.title}" if m.post else "No post",
     }
 
+    def list_query(self, request):
+        # Same narrowing as PostAdmin; the post relation is only touched
+        # by the detail formatters, and the details page eager-loads it
+        # on its own, so it doesn't belong here.
+        return select(Comment).options(
+            selectinload(Comment.owner).options(load_only(User.email, User.full_name))
+        )
+
     icon = "fa-solid fa-comment"
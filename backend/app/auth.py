@@ -1,6 +1,10 @@
+import hashlib
+import time
 import uuid
+from collections import OrderedDict
 
-from fastapi_users import FastAPIUsers
+import jwt
+from fastapi_users import FastAPIUsers, exceptions
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
@@ -12,13 +16,84 @@ from .config import get_settings
 from .manager import get_user_manager  # <-- Import from new file
 from .models import User
 
+settings = get_settings()
+
+# Evaluated once: whether cookies must be marked Secure.
+_COOKIE_SECURE = settings.ENVIRONMENT == "production"
+
+# --- 1. Token decoding ---
+
+# Prepare the HMAC key and PyJWT instance once at import time so token
+# verification on the hot path is just HMAC-SHA256 over header.payload,
+# without per-call key preparation or option parsing.
+_jwt_codec = jwt.PyJWT()
+_JWT_KEY = jwt.algorithms.HMACAlgorithm(
+    jwt.algorithms.HMACAlgorithm.SHA256
+).prepare_key(settings.JWT_SECRET)
+_JWT_ALGORITHMS = ["HS256"]
+
+
+def decode_token(token: str, audience: str) -> dict:
+    """
+    Decode and verify one of our HS256 tokens with the precomputed key.
+    Raises the usual jwt.InvalidTokenError subclasses on failure.
+    """
+    return _jwt_codec.decode(
+        token,
+        _JWT_KEY,
+        audience=audience,
+        algorithms=_JWT_ALGORITHMS,
+    )
+
+
 # --- 2. JWT Strategies ---
 
+# Verified access tokens are cached per process for a short window so
+# repeat requests skip the HMAC verify and claims parsing. Only the
+# verified user id is cached — never the ORM instance, which is bound to
+# one request's session and would raise DetachedInstanceError on the
+# next request (or after any rollback). The user row is re-read through
+# the current request's session on every hit, so the is_active /
+# is_verified flags are always fresh. Entries are keyed by token digest
+# and bounded LRU-style.
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAX = 10_000
+
+
+class CachedJWTStrategy(JWTStrategy):
+    # Shared across instances: a new strategy is built per request.
+    _cache: OrderedDict = OrderedDict()
+
+    async def read_token(self, token, user_manager):
+        if token is None:
+            return None
+
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        entry = self._cache.get(key)
+        if entry is not None:
+            user_id, expires_at = entry
+            if expires_at > now:
+                self._cache.move_to_end(key)
+                try:
+                    return await user_manager.get(user_id)
+                except exceptions.UserNotExists:
+                    del self._cache[key]
+                    return None
+            del self._cache[key]
+
+        user = await super().read_token(token, user_manager)
+        if user is not None:
+            self._cache[key] = (user.id, now + _TOKEN_CACHE_TTL)
+            if len(self._cache) > _TOKEN_CACHE_MAX:
+                self._cache.popitem(last=False)
+        return user
+
 
 # Short-lived ACCESS token (15 minutes)
 def get_access_token_strategy() -> JWTStrategy:
-    return JWTStrategy(
-        secret=get_settings().JWT_SECRET,
+    return CachedJWTStrategy(
+        secret=settings.JWT_SECRET,
         lifetime_seconds=900,  # 15 minutes
     )
 
@@ -26,7 +101,7 @@ def get_access_token_strategy() -> JWTStrategy:
 # Long-lived REFRESH token (7 days)
 def get_refresh_token_strategy() -> JWTStrategy:
     return JWTStrategy(
-        secret=get_settings().JWT_SECRET,
+        secret=settings.JWT_SECRET,
         lifetime_seconds=604800,  # 7 days
     )
 
@@ -41,7 +116,7 @@ cookie_transport = CookieTransport(
     cookie_name="refresh_token",
     cookie_max_age=604800,
     cookie_httponly=True,
-    cookie_secure=get_settings().ENVIRONMENT == "production",
+    cookie_secure=_COOKIE_SECURE,
     cookie_samesite="lax",
 )
 
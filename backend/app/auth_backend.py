@@ -1,10 +1,145 @@
+import json
+import struct
+import time
+import uuid
+from base64 import b64decode, b64encode
+
+import itsdangerous
+from fastapi_users.password import PasswordHelper
+from itsdangerous.exc import BadSignature
 from sqladmin.authentication import AuthenticationBackend
-from sqlalchemy import select
-from starlette.requests import Request
+from sqlalchemy import bindparam, select
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection, Request
 
 from .database import async_session_maker
 from .models import User
 
+# Built once at import time: PasswordHelper sets up a CryptContext, which
+# is too expensive to recreate on every login attempt.
+_password_helper = PasswordHelper()
+
+# Statement constructed once; only the email bind parameter varies.
+# Column-only select: login just needs the hash and flags, no ORM entity.
+_user_by_email_query = select(
+    User.id,
+    User.email,
+    User.hashed_password,
+    User.is_active,
+    User.is_superuser,
+).where(User.email == bindparam("email"))
+
+# TTL-expiry re-check in authenticate(): flags only, by primary key.
+_user_flags_query = select(User.id, User.is_active, User.is_superuser).where(
+    User.id == bindparam("user_id")
+)
+
+# How long (seconds) an authenticated admin session is trusted before we
+# re-check the user row in the database. The session cookie itself is
+# signed by SessionMiddleware, so this only bounds how stale the
+# is_active/is_superuser flags can get.
+AUTH_CACHE_TTL = 60
+
+# --- Session cookie codec ---
+# The admin session is exactly these three keys, so the common case can be
+# struct-packed instead of JSON-encoded: 1 version byte + 16 UUID bytes +
+# 8 bytes of expiry double + the email. Anything else (or a tampered
+# cookie) falls back to a JSON payload behind a different version byte.
+_SESSION_KEYS = frozenset({"user_id", "user_email", "auth_exp"})
+_PACKED_V1 = b"\x01"
+_JSON_V0 = b"\x00"
+
+
+def _encode_session(session: dict) -> bytes:
+    if session.keys() == _SESSION_KEYS:
+        try:
+            payload = (
+                _PACKED_V1
+                + uuid.UUID(session["user_id"]).bytes
+                + struct.pack("!d", session["auth_exp"])
+                + session["user_email"].encode("utf-8")
+            )
+            return b64encode(payload)
+        except (ValueError, AttributeError, TypeError):
+            pass
+    return b64encode(_JSON_V0 + json.dumps(session).encode("utf-8"))
+
+
+def _decode_session(data: bytes) -> dict:
+    payload = b64decode(data)
+    if payload[:1] == _PACKED_V1:
+        return {
+            "user_id": str(uuid.UUID(bytes=payload[1:17])),
+            "auth_exp": struct.unpack("!d", payload[17:25])[0],
+            "user_email": payload[25:].decode("utf-8"),
+        }
+    return json.loads(payload[1:])
+
+
+class CompactSessionMiddleware:
+    """
+    Signed-cookie session middleware, drop-in for Starlette's
+    SessionMiddleware but with the binary codec above instead of
+    JSON + UTF-8 decode on every admin request.
+    """
+
+    def __init__(
+        self,
+        app,
+        secret_key: str,
+        session_cookie: str = "session",
+        max_age: int = 14 * 24 * 60 * 60,  # 14 days, same as Starlette
+        https_only: bool = False,
+    ):
+        self.app = app
+        self.signer = itsdangerous.TimestampSigner(str(secret_key))
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.security_flags = "httponly; samesite=lax"
+        if https_only:
+            self.security_flags += "; secure"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        initial_session_was_empty = True
+
+        if self.session_cookie in connection.cookies:
+            data = connection.cookies[self.session_cookie].encode("utf-8")
+            try:
+                data = self.signer.unsign(data, max_age=self.max_age)
+                scope["session"] = _decode_session(data)
+                initial_session_was_empty = False
+            except (BadSignature, ValueError, KeyError):
+                scope["session"] = {}
+        else:
+            scope["session"] = {}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                if scope["session"]:
+                    data = self.signer.sign(_encode_session(scope["session"]))
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{self.session_cookie}={data.decode('utf-8')}; "
+                        f"path=/; Max-Age={self.max_age}; {self.security_flags}",
+                    )
+                elif not initial_session_was_empty:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{self.session_cookie}=null; path=/; "
+                        f"expires=Thu, 01 Jan 1970 00:00:00 GMT; "
+                        f"{self.security_flags}",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
 
 class AdminAuthBackend(AuthenticationBackend):
     """
@@ -12,6 +147,27 @@ class AdminAuthBackend(AuthenticationBackend):
     This is the CORRECT way to protect the entire admin panel.
     """
 
+    def __init__(self, secret_key):
+        super().__init__(secret_key)
+        # The base class mounts Starlette's stock SessionMiddleware on the
+        # admin sub-app. It reads the same "session" cookie as the
+        # app-wide CompactSessionMiddleware, can't decode the packed
+        # payload, and double-sets the cookie — so don't mount it.
+        self.middlewares = []
+
+    @staticmethod
+    async def _execute(request: Request, stmt, params):
+        """
+        Run a statement on the request-scoped session when
+        DBSessionMiddleware seeded one, instead of checking out a
+        dedicated pool connection per admin request.
+        """
+        db = request.scope.get("state", {}).get("db")
+        if db is not None:
+            return await db.execute(stmt, params)
+        async with async_session_maker() as session:
+            return await session.execute(stmt, params)
+
     async def login(self, request: Request) -> bool:
         """
         Handle login form submission.
@@ -21,35 +177,30 @@ class AdminAuthBackend(AuthenticationBackend):
         username = form.get("username")  # SQLAdmin uses 'username' field
         password = form.get("password")
 
-        # Get user manager
-        async with async_session_maker() as session:
-            # Find user by email
-            result = await session.execute(select(User).where(User.email == username))
-            user = result.scalar_one_or_none()
+        # Find user by email
+        result = await self._execute(request, _user_by_email_query, {"email": username})
+        row = result.first()
 
-            if not user:
-                return False
-
-            # Verify password using fastapi-users manager
-            from fastapi_users.password import PasswordHelper
-
-            password_helper = PasswordHelper()
+        if not row:
+            return False
 
-            verified, updated_hash = password_helper.verify_and_update(
-                password, user.hashed_password
-            )
+        # Verify password using fastapi-users' helper
+        verified, updated_hash = _password_helper.verify_and_update(
+            password, row.hashed_password
+        )
 
-            if not verified:
-                return False
+        if not verified:
+            return False
 
-            # Check if user is active and superuser
-            if not user.is_active or not user.is_superuser:
-                return False
+        # Check if user is active and superuser
+        if not row.is_active or not row.is_superuser:
+            return False
 
-            # Store user info in session
-            request.session["user_id"] = str(user.id)
-            request.session["user_email"] = user.email
-            return True
+        # Store user info in session
+        request.session["user_id"] = str(row.id)
+        request.session["user_email"] = row.email
+        request.session["auth_exp"] = time.time() + AUTH_CACHE_TTL
+        return True
 
     async def logout(self, request: Request) -> bool:
         """
@@ -68,13 +219,19 @@ class AdminAuthBackend(AuthenticationBackend):
         if not user_id:
             return False
 
-        # Verify user still exists and is still a superuser
-        async with async_session_maker() as session:
-            result = await session.execute(select(User).where(User.id == user_id))
-            user = result.scalar_one_or_none()
+        # Trust the signed session within its TTL — this avoids one DB
+        # round-trip per admin page/asset request.
+        if request.session.get("auth_exp", 0) > time.time():
+            return True
 
-            if not user or not user.is_active or not user.is_superuser:
-                request.session.clear()
-                return False
+        # TTL expired: verify user still exists and is still a superuser.
+        # Column-only select, we don't need the full ORM entity here.
+        result = await self._execute(request, _user_flags_query, {"user_id": user_id})
+        row = result.one_or_none()
 
-            return True
+        if not row or not row.is_active or not row.is_superuser:
+            request.session.clear()
+            return False
+
+        request.session["auth_exp"] = time.time() + AUTH_CACHE_TTL
+        return True
@@ -1,5 +1,6 @@
 # app/comments.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, lambda_stmt, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
@@ -27,23 +28,52 @@ async def update_comment(
     """
     logger.info(f"User {user.email} attempting to update comment {comment_id}")
 
-    # Use selectinload to get the owner relationship, which is
-    # required by the CommentReadWithUser response model.
-    query = (
-        select(Comment)
-        .where(Comment.id == comment_id)
-        .options(selectinload(Comment.owner))
-    )
-    result = await session.execute(query)
+    update_data = comment_update.model_dump(exclude_unset=True)
+
+    # Single round-trip: the WHERE clause handles the ownership check and
+    # RETURNING gives us the updated row back, replacing the old
+    # SELECT + UPDATE + REFRESH sequence.
+    if update_data:
+        stmt = (
+            update(Comment)
+            .where(Comment.id == comment_id, Comment.owner_id == user.id)
+            .values(**update_data)
+            .returning(Comment)
+        )
+        result = await session.execute(
+            select(Comment)
+            .from_statement(stmt)
+            .options(selectinload(Comment.owner))
+            .execution_options(populate_existing=True)
+        )
+    else:
+        # Nothing to write; just load the comment with the same guards.
+        # Close over plain scalars only: tracking the persistent User
+        # instance sends the lambda closure analysis into a recursion.
+        user_id = user.id
+        result = await session.execute(
+            lambda_stmt(
+                lambda: (
+                    select(Comment)
+                    .where(Comment.id == comment_id, Comment.owner_id == user_id)
+                    .options(selectinload(Comment.owner))
+                )
+            )
+        )
     comment = result.scalar_one_or_none()
 
     if comment is None:
-        logger.warning(f"Comment {comment_id} not found.")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+        # The update matched no row: decide 404 vs 403 with one cheap probe.
+        owner_id = await session.scalar(
+            lambda_stmt(
+                lambda: select(Comment.owner_id).where(Comment.id == comment_id)
+            )
         )
-
-    if comment.owner_id != user.id:
+        if owner_id is None:
+            logger.warning(f"Comment {comment_id} not found.")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+            )
         logger.warning(
             f"User {user.email} failed to update comment {comment_id}: Not owner."
         )
@@ -52,14 +82,7 @@ async def update_comment(
             detail="Not authorized to update this comment",
         )
 
-    # Update the data
-    update_data = comment_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(comment, key, value)
-
-    session.add(comment)
     await session.commit()
-    await session.refresh(comment)
 
     logger.success(f"Comment {comment_id} updated successfully by {user.email}")
     return comment
@@ -77,17 +100,27 @@ async def delete_comment(
     """
     logger.info(f"User {user.email} attempting to delete comment {comment_id}")
 
-    # We only need to fetch the comment, no relationships needed
-    result = await session.execute(select(Comment).where(Comment.id == comment_id))
-    comment = result.scalar_one_or_none()
-
-    if comment is None:
-        logger.warning(f"Comment {comment_id} not found.")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+    # Conditional delete in one round-trip: the WHERE clause enforces
+    # ownership and RETURNING tells us whether a row was hit.
+    result = await session.execute(
+        delete(Comment)
+        .where(Comment.id == comment_id, Comment.owner_id == user.id)
+        .returning(Comment.id)
+    )
+    deleted_id = result.scalar_one_or_none()
+
+    if deleted_id is None:
+        # Nothing deleted: decide 404 vs 403 with one cheap probe.
+        owner_id = await session.scalar(
+            lambda_stmt(
+                lambda: select(Comment.owner_id).where(Comment.id == comment_id)
+            )
         )
-
-    if comment.owner_id != user.id:
+        if owner_id is None:
+            logger.warning(f"Comment {comment_id} not found.")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
+            )
         logger.warning(
             f"User {user.email} failed to delete comment {comment_id}: Not owner."
         )
@@ -96,7 +129,6 @@ async def delete_comment(
             detail="Not authorized to delete this comment",
         )
 
-    await session.delete(comment)
     await session.commit()
 
     logger.success(f"Comment {comment_id} deleted successfully by {user.email}")
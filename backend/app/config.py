@@ -28,8 +28,9 @@ class Settings(BaseSettings):
     MAIL_FROM_NAME: str
     # --------------------------
 
-    # Environment file location
-    model_config = SettingsConfigDict(env_file=".env")
+    # Environment file location; frozen so attribute access stays a plain
+    # read and the cached instance can't be mutated at runtime.
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
 
 
 @lru_cache
@@ -1,35 +1,90 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+import random
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.requests import Request
 
 from .config import get_settings
+from .logging_config import logger
+
+settings = get_settings()
 
 # Get the database URL from our settings
-DATABASE_URL = get_settings().DATABASE_URL
+DATABASE_URL = settings.DATABASE_URL
+
+# How many connections the pool keeps open. Also used by the lifespan
+# handler to pre-create connections on startup.
+POOL_SIZE = 25
+
+# Create the async engine with an explicitly tuned pool instead of the
+# defaults (pool_size=5), which starve the app under concurrency.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=settings.ENVIRONMENT == "development",
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=25,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+
+# Sampled SQL tracing for production diagnostics. echo=True formats a log
+# record for every statement, which is pure CPU overhead under load; this
+# logs roughly 1 in 1000 statements instead.
+SQL_SAMPLE_RATE = 0.001
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _sample_sql_statements(conn, cursor, statement, parameters, context, executemany):
+    if random.random() < SQL_SAMPLE_RATE:
+        logger.debug(f"🧩 SQL sample: {statement}")
 
-# Create the async engine
-# 'echo=True' is great for development, it logs all SQL queries
-engine = create_async_engine(DATABASE_URL, echo=True)
 
 # Create the session factory
 # This is what we'll use to create new sessions
 async_session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
 
-# This is the base class all your models will inherit from
-Base = declarative_base()
 
+# This is the base class all your models will inherit from.
+# 2.x-style DeclarativeBase builds its registry/metadata once at class
+# creation instead of going through the legacy declarative_base() shims.
+class Base(DeclarativeBase):
+    pass
 
-# This is the dependency we will use in our routes
-async def get_db_session():
+
+# Pure ASGI middleware that opens one session per request and parks it on
+# the scope state. Opening an AsyncSession is lazy (no connection is
+# acquired until first use), so this is cheap even for non-DB routes, and
+# it spares FastAPI a generator-dependency wrap per session-typed dep.
+class DBSessionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with async_session_maker() as session:
+            scope.setdefault("state", {})["db"] = session
+            try:
+                await self.app(scope, receive, send)
+            except Exception:
+                await session.rollback()
+                raise
+
+
+# This is the dependency we will use in our routes. async so FastAPI
+# awaits it inline — a plain def would be pushed to the threadpool.
+async def get_db_session(request: Request) -> AsyncSession:
     """
-    Dependency function to get an async database session.
-    This ensures the session is always closed, even if an error occurs.
+    Dependency function to get the request-scoped database session.
+    The session is opened and closed by DBSessionMiddleware.
     """
-
-    async with async_session_maker() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+    return request.state.db
@@ -1,14 +1,14 @@
 # app/dependencies.py
-from fastapi import Depends
+from fastapi import Request
 from fastapi_users.db import SQLAlchemyUserDatabase
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import get_db_session
 from .models import User
 
 
-async def get_user_db(session: AsyncSession = Depends(get_db_session)):
+async def get_user_db(request: Request) -> SQLAlchemyUserDatabase:
     """
-    Dependency to get the SQLAlchemyUserDatabase adapter.
+    Dependency to get the SQLAlchemyUserDatabase adapter, wrapping the
+    request-scoped session from DBSessionMiddleware. async so FastAPI
+    awaits it inline instead of hopping to the threadpool.
     """
-    yield SQLAlchemyUserDatabase(session, User)
+    return SQLAlchemyUserDatabase(request.state.db, User)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema, MessageType
 from pydantic import EmailStr
 
@@ -22,43 +24,54 @@ conf = ConnectionConfig(
     VALIDATE_CERTS=True,
 )
 
+# One FastMail per process — constructing it per send re-validates the
+# whole ConnectionConfig each time. fastapi-mail still opens an SMTP
+# session per send_message under the hood; it has no pooling API.
+fm = FastMail(conf)
+
+
+# Simple HTML template for the email, built once at import time; each
+# send only substitutes the greeting and token.
+_VERIFICATION_HTML = """
+<html>
+    <body>
+        <div style="font-family: Arial, sans-serif; line-height: 1.6;">
+            <h2>Hello, {greeting}!</h2>
+            <p>Welcome to our application! We're excited to have you.</p>
+            <p>Please click the button below to verify your email address:</p>
+            <a href="http://localhost:8000/auth/verify?token={token}"
+               style="background-color: #007BFF; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block;">
+                Verify Your Email
+            </a>
+            <p>If the button doesn't work, copy and paste this link into your browser:</p>
+            <p style="color: #666; font-size: 12px;">http://localhost:8000/auth/verify?token={token}</p>
+            <p>If you did not create an account, please ignore this email.</p>
+            <p>Thanks,<br>The Team</p>
+        </div>
+    </body>
+</html>
+"""
+
+# Shared message defaults; only recipients and body vary per send.
+_verification_message = partial(
+    MessageSchema,
+    subject="Verify Your Email Address",
+    subtype=MessageType.html,
+)
+
 
 async def send_verification_email(email_to: EmailStr, user: User, token: str):
     """
     Sends the verification email to a new user.
     """
-
-    # Simple HTML template for the email
-    html_template = f"""
-    <html>
-        <body>
-            <div style="font-family: Arial, sans-serif; line-height: 1.6;">
-                <h2>Hello, {user.full_name or user.email}!</h2>
-                <p>Welcome to our application! We're excited to have you.</p>
-                <p>Please click the button below to verify your email address:</p>
-                <a href="http://localhost:8000/auth/verify?token={token}" 
-                   style="background-color: #007BFF; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block;">
-                    Verify Your Email
-                </a>
-                <p>If the button doesn't work, copy and paste this link into your browser:</p>
-                <p style="color: #666; font-size: 12px;">http://localhost:8000/auth/verify?token={token}</p>
-                <p>If you did not create an account, please ignore this email.</p>
-                <p>Thanks,<br>The Team</p>
-            </div>
-        </body>
-    </html>
-    """
+    greeting = user.full_name or user.email
 
     # Create the email message
-    message = MessageSchema(
-        subject="Verify Your Email Address",
+    message = _verification_message(
         recipients=[email_to],
-        body=html_template,
-        subtype=MessageType.html,
+        body=_VERIFICATION_HTML.format_map({"greeting": greeting, "token": token}),
     )
 
-    # Initialize FastMail and send
-    fm = FastMail(conf)
     try:
         logger.info(f"📧 Sending verification email to {email_to} ...")
         await fm.send_message(message)
@@ -1,6 +1,8 @@
 # app/logging_config.py
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
 
 from loguru import logger
@@ -28,6 +30,31 @@ LEVEL_EMOJIS = {
 }
 
 
+# Escape table for function names so they can't be read as color tags;
+# built once, and only applied when a name actually contains brackets
+# (e.g. <module>, <lambda>) — the common case skips the translate call.
+_ANGLE_ESC = str.maketrans({"<": r"\<", ">": r"\>"})
+
+
+def _escape_function(func: str) -> str:
+    if "<" in func or ">" in func:
+        return func.translate(_ANGLE_ESC)
+    return func
+
+
+# The set of logger names is small and fixed after startup, so memoize
+# the "is this a sqlalchemy record?" prefix check instead of running
+# str.startswith on every record in both formatters.
+_IS_SQLA_CACHE: dict = {}
+
+
+def _is_sqlalchemy(name: str) -> bool:
+    is_sqla = _IS_SQLA_CACHE.get(name)
+    if is_sqla is None:
+        is_sqla = _IS_SQLA_CACHE[name] = name.startswith("sqlalchemy")
+    return is_sqla
+
+
 def formatter(record):
     """Custom console log format (safe for missing extras)."""
     level_name = record["level"].name
@@ -37,9 +64,9 @@ def formatter(record):
     path = record["extra"].get("path", "")
 
     # 👇 FIX: Escape the function name to prevent color tag errors
-    func_name = record["function"].replace("<", r"\<").replace(">", r"\>")
+    func_name = _escape_function(record["function"])
 
-    if record["name"].startswith("sqlalchemy"):
+    if _is_sqlalchemy(record["name"]):
         emoji = LEVEL_EMOJIS["SQLALCHEMY"]
         return (
             f"<green>{record['time']:YYYY-MM-DD HH:mm:ss}</green> "
@@ -61,13 +88,46 @@ def formatter(record):
 
 LOG_LEVEL = "DEBUG" if IS_DEVELOPMENT else "INFO"
 
+
+class _QueuedStream:
+    """
+    File-like wrapper that hands formatted records to a bounded queue
+    drained by a single daemon thread, so a slow or blocked terminal
+    can't stall request handlers. Records are dropped (and counted)
+    when the queue is full. Loguru's own enqueue machinery isn't used:
+    it requires a multiprocessing context and an unbounded queue, and
+    both sinks live in this process anyway.
+    """
+
+    def __init__(self, stream, maxsize: int = 10_000):
+        self._stream = stream
+        self._queue = queue.Queue(maxsize)
+        self.dropped = 0
+        threading.Thread(target=self._drain, daemon=True).start()
+
+    def write(self, message):
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        pass
+
+    def _drain(self):
+        while True:
+            self._stream.write(self._queue.get())
+            self._stream.flush()
+
+
 logger.add(
-    sys.stderr,
+    sys.stderr if IS_DEVELOPMENT else _QueuedStream(sys.stderr),
     format=formatter,
     colorize=True,
     level=LOG_LEVEL,
-    enqueue=not IS_DEVELOPMENT,
-    backtrace=True,
+    # Extended tracebacks walk and format the whole stack on every
+    # exception log; keep that (and variable inspection) out of production.
+    backtrace=IS_DEVELOPMENT,
     diagnose=False,
 )
 
@@ -79,9 +139,9 @@ def file_formatter(record):
     emoji = LEVEL_EMOJIS.get(record["level"].name, "💬")
 
     # 👇 FIX: Escape the function name
-    func_name = record["function"].replace("<", r"\<").replace(">", r"\>")
+    func_name = _escape_function(record["function"])
 
-    if record["name"].startswith("sqlalchemy"):
+    if _is_sqlalchemy(record["name"]):
         emoji = LEVEL_EMOJIS["SQLALCHEMY"]
 
     return (
@@ -97,21 +157,55 @@ logger.add(
     compression="zip",
     level="DEBUG",
     format=file_formatter,
-    enqueue=not IS_DEVELOPMENT,
+    backtrace=IS_DEVELOPMENT,
+    diagnose=False,
+    # 1 MiB write buffer outside development: one write() syscall per
+    # buffer-full instead of per record, which already keeps this sink
+    # cheap enough to run inline. Line-buffered in development so the
+    # file can be tailed live.
+    buffering=(1 << 20) if not IS_DEVELOPMENT else 1,
 )
 
 
 class InterceptHandler(logging.Handler):
+    # Safety bound for the frame walk below; stdlib logging indirection
+    # never nests deeper than a handful of frames.
+    _MAX_DEPTH = 20
+
+    # The walk result is stable per call site, so remember it keyed by
+    # (pathname, lineno) — sys._getframe is slow and the records from a
+    # hot call site all take the same path through the logging module.
+    _depth_cache: dict = {}
+
     def emit(self, record: logging.LogRecord):
+        # Engine INFO/DEBUG records carry every statement and parameter
+        # dump; outside development skip them before Loguru does any
+        # formatting work. WARNING and above are real engine problems and
+        # must still get through.
+        if (
+            not IS_DEVELOPMENT
+            and record.levelno < logging.WARNING
+            and record.name.startswith("sqlalchemy.engine")
+        ):
+            return
+
         try:
             level = logger.level(record.levelname).name
         except ValueError:
             level = record.levelno
 
-        frame, depth = sys._getframe(6), 6
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+        cache_key = (record.pathname, record.lineno)
+        depth = self._depth_cache.get(cache_key)
+        if depth is None:
+            frame, depth = sys._getframe(6), 6
+            while (
+                frame
+                and frame.f_code.co_filename == logging.__file__
+                and depth < self._MAX_DEPTH
+            ):
+                frame = frame.f_back
+                depth += 1
+            self._depth_cache[cache_key] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
@@ -125,7 +219,9 @@ for name in ["uvicorn", "uvicorn.access", "uvicorn.error"]:
     logging.getLogger(name).handlers = []
     logging.getLogger(name).propagate = True
 
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if IS_DEVELOPMENT else logging.WARNING
+)
 logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
 
 for name in list(logging.root.manager.loggerDict):
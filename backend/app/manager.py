@@ -1,5 +1,6 @@
+import asyncio
+import time
 import uuid
-from datetime import datetime, timedelta
 
 import jwt
 from fastapi import Depends, Request
@@ -11,10 +12,23 @@ from .dependencies import get_user_db
 from .email import send_verification_email
 from .models import User
 
+settings = get_settings()
+
+# PyJWT instance and prepared HMAC key built once at import time, so each
+# token signing skips key preparation.
+_jwt_codec = jwt.PyJWT()
+_JWT_KEY = jwt.algorithms.HMACAlgorithm(
+    jwt.algorithms.HMACAlgorithm.SHA256
+).prepare_key(settings.JWT_SECRET)
+
+# Strong references to in-flight email tasks so they aren't garbage
+# collected before completion.
+_email_tasks: set[asyncio.Task] = set()
+
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
-    reset_password_token_secret = get_settings().JWT_SECRET
-    verification_token_secret = get_settings().JWT_SECRET
+    reset_password_token_secret = settings.JWT_SECRET
+    verification_token_secret = settings.JWT_SECRET
 
     async def on_after_register(self, user: User, request: Request | None = None):
         """
@@ -27,14 +41,15 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
             "sub": str(user.id),
             "email": user.email,
             "aud": "fastapi-users:verify",
-            "exp": datetime.utcnow() + timedelta(hours=24),  # Token expires in 24 hours
+            "exp": int(time.time()) + 86400,  # Token expires in 24 hours
         }
-        token = jwt.encode(
-            token_data, self.verification_token_secret, algorithm="HS256"
-        )
+        token = _jwt_codec.encode(token_data, _JWT_KEY, algorithm="HS256")
 
-        # Send the verification email
-        await self.send_verification_email(user, token, request)
+        # Send the verification email in the background so the register
+        # response isn't blocked on the SMTP handshake and send.
+        task = asyncio.create_task(self.send_verification_email(user, token, request))
+        _email_tasks.add(task)
+        task.add_done_callback(_email_tasks.discard)
 
     async def send_verification_email(
         self, user: User, token: str, request: Request | None = None
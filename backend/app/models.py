@@ -3,7 +3,7 @@ from datetime import datetime
 
 from app.database import Base
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -26,12 +26,19 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
 class Post(Base):
     __tablename__ = "posts"
     id: Mapped[int] = mapped_column(primary_key=True)
-    title: Mapped[str] = mapped_column(String(100), index=True)
+    # No index: nothing queries posts by title, and the index taxed
+    # every insert/update for no read benefit.
+    title: Mapped[str] = mapped_column(String(100))
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
     image_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     video_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # ImageKit file IDs, stored at upload time so deletes are a single
+    # API call instead of a list_files search by path.
+    image_file_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    video_file_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Indexed: get_all_posts orders by created_at DESC on every page load
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), server_default=func.now(), index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -39,8 +46,8 @@ class Post(Base):
         onupdate=func.now(),
     )
 
-    # Foreign Key to User
-    owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
+    # Foreign Key to User (indexed: update/delete filter on owner_id)
+    owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), index=True)
 
     # Relationship back to User
     owner: Mapped["User"] = relationship(back_populates="posts")
@@ -54,6 +61,9 @@ class Post(Base):
 # --- New Comment Model ---
 class Comment(Base):
     __tablename__ = "comments"
+    # get_comments_for_post filters on post_id and orders by created_at;
+    # this composite index makes that a single index range scan, no sort.
+    __table_args__ = (Index("ix_comments_post_created", "post_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     content: Mapped[str] = mapped_column(Text)
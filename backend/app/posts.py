@@ -1,11 +1,15 @@
 # --- 👇 1. ADD THIS IMPORT ---
 import asyncio
+from datetime import datetime
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, insert, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from .auth import current_active_verified_user
 from .database import get_db_session
@@ -14,6 +18,7 @@ from .schemas import (
     CommentCreate,
     CommentReadWithUser,
     PostCreate,
+    PostPage,
     PostRead,
     PostReadWithDetails,
     PostUpdate,
@@ -22,8 +27,27 @@ from .schemas import (
 # --- 👇 2. ADD THIS IMPORT ---
 from .utils import delete_file_from_imagekit
 
-# Create a new router
-router = APIRouter(prefix="/posts", tags=["Posts"])
+# Create a new router. orjson serializes the post/comment payloads
+# (UUIDs and datetimes included) several times faster than stdlib json.
+router = APIRouter(
+    prefix="/posts", tags=["Posts"], default_response_class=ORJSONResponse
+)
+
+# Strong references to in-flight ImageKit delete tasks so they aren't
+# garbage collected before completion.
+_imagekit_tasks: set[asyncio.Task] = set()
+
+
+def _delete_in_background(*files: tuple[str | None, str | None]):
+    """
+    Fire off ImageKit deletes of (url, file_id) pairs without blocking
+    the response; delete_file_from_imagekit logs its own failures.
+    """
+    for file_url, file_id in files:
+        if file_url or file_id:
+            task = asyncio.create_task(delete_file_from_imagekit(file_url, file_id))
+            _imagekit_tasks.add(task)
+            task.add_done_callback(_imagekit_tasks.discard)
 
 
 # === 1. Create Post (NO CHANGES) ===
@@ -43,18 +67,37 @@ async def create_post(
     return new_post
 
 
-# === 2. Get All Posts (NO CHANGES) ===
-@router.get("/", response_model=List[PostRead])
+# === 2. Get All Posts ===
+@router.get("/", response_model=PostPage)
 async def get_all_posts(
-    session: AsyncSession = Depends(get_db_session), skip: int = 0, limit: int = 10
+    session: AsyncSession = Depends(get_db_session),
+    after: datetime | None = None,
+    after_id: int | None = None,
+    limit: int = 10,
 ):
     """
-    Get all posts. This endpoint is public.
+    Get all posts, keyset-paginated on (created_at, id). This endpoint is
+    public. Pass the next_after/next_after_id cursor from the previous
+    page to fetch the next one; unlike OFFSET, page N costs the same as
+    page 0.
     """
-    query = select(Post).order_by(Post.created_at.desc()).offset(skip).limit(limit)
+    query = select(Post).order_by(Post.created_at.desc(), Post.id.desc()).limit(limit)
+    if after is not None and after_id is not None:
+        query = query.where(
+            or_(
+                Post.created_at < after,
+                and_(Post.created_at == after, Post.id < after_id),
+            )
+        )
     result = await session.execute(query)
     posts = result.scalars().all()
-    return posts
+
+    next_after = next_after_id = None
+    if len(posts) == limit:
+        next_after = posts[-1].created_at
+        next_after_id = posts[-1].id
+
+    return PostPage(items=posts, next_after=next_after, next_after_id=next_after_id)
 
 
 # === 3. Get Single Post (NO CHANGES) ===
@@ -63,12 +106,15 @@ async def get_post_by_id(post_id: int, session: AsyncSession = Depends(get_db_se
     """
     Get a single post by its ID. Public and includes details.
     """
+    # joinedload folds the owner into the main query and the comment
+    # owners into the comments batch: 2 round-trips total instead of 3+,
+    # regardless of comment count.
     query = (
         select(Post)
         .where(Post.id == post_id)
         .options(
-            selectinload(Post.owner),
-            selectinload(Post.comments).selectinload(Comment.owner),
+            joinedload(Post.owner),
+            selectinload(Post.comments).joinedload(Comment.owner),
         )
     )
     result = await session.execute(query)
@@ -92,43 +138,73 @@ async def update_post(
     """
     Update a post. The user must be the owner AND VERIFIED.
     """
-    result = await session.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
+    update_data = post_update.model_dump(exclude_unset=True)
 
-    if post is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
+    # Grab the old URLs (columns only) before the update so we can delete
+    # replaced files from ImageKit afterwards. RETURNING only gives us the
+    # new values, so this narrow probe is the one extra round-trip we keep
+    # — and only when a URL field is actually changing.
+    old_image_url = old_video_url = None
+    old_image_file_id = old_video_file_id = None
+    if "image_url" in update_data or "video_url" in update_data:
+        old = (
+            await session.execute(
+                select(
+                    Post.image_url,
+                    Post.video_url,
+                    Post.image_file_id,
+                    Post.video_file_id,
+                ).where(Post.id == post_id)
+            )
+        ).first()
+        if old is not None:
+            if "image_url" in update_data:
+                old_image_url = old.image_url
+                old_image_file_id = old.image_file_id
+            if "video_url" in update_data:
+                old_video_url = old.video_url
+                old_video_file_id = old.video_file_id
+
+    # Single round-trip: ownership check in the WHERE clause, updated row
+    # back via RETURNING — no flush, no refresh.
+    if update_data:
+        stmt = (
+            update(Post)
+            .where(Post.id == post_id, Post.owner_id == user.id)
+            .values(**update_data)
+            .returning(Post)
+        )
+        result = await session.execute(
+            select(Post).from_statement(stmt).execution_options(populate_existing=True)
         )
+    else:
+        result = await session.execute(
+            select(Post).where(Post.id == post_id, Post.owner_id == user.id)
+        )
+    post = result.scalar_one_or_none()
 
-    if post.owner_id != user.id:
+    if post is None:
+        # The update matched no row: decide 404 vs 403 with one cheap probe.
+        owner_id = await session.scalar(select(Post.owner_id).where(Post.id == post_id))
+        if owner_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this post",
         )
 
-    update_data = post_update.model_dump(exclude_unset=True)
-
-    # Store old URLs *before* updating the post object,
-    # so we can delete them from ImageKit after the update.
-    old_image_url = post.image_url if "image_url" in update_data else None
-    old_video_url = post.video_url if "video_url" in update_data else None
-
-    for key, value in update_data.items():
-        setattr(post, key, value)
-
-    session.add(post)
     await session.commit()
-    await session.refresh(post)
 
-    # Now that the DB update is successful, delete the old files.
-    delete_tasks = []
+    # Now that the DB update is successful, delete the old files in the
+    # background — no reason to block the response on ImageKit.
+    files_to_delete = []
     if old_image_url and old_image_url != post.image_url:
-        delete_tasks.append(delete_file_from_imagekit(old_image_url))
+        files_to_delete.append((old_image_url, old_image_file_id))
     if old_video_url and old_video_url != post.video_url:
-        delete_tasks.append(delete_file_from_imagekit(old_video_url))
-
-    if delete_tasks:
-        await asyncio.gather(*delete_tasks)
+        files_to_delete.append((old_video_url, old_video_file_id))
+    _delete_in_background(*files_to_delete)
 
     return post
 
@@ -157,22 +233,16 @@ async def delete_post(
             detail="Not authorized to delete this post",
         )
 
-    # Store the URLs before we delete the post from the DB
-    image_url_to_delete = post.image_url
-    video_url_to_delete = post.video_url
+    # Store the URLs and file IDs before we delete the post from the DB
+    image_to_delete = (post.image_url, post.image_file_id)
+    video_to_delete = (post.video_url, post.video_file_id)
 
     await session.delete(post)
     await session.commit()
 
-    # Now that the post is deleted from the DB, delete files from ImageKit
-    delete_tasks = []
-    if image_url_to_delete:
-        delete_tasks.append(delete_file_from_imagekit(image_url_to_delete))
-    if video_url_to_delete:
-        delete_tasks.append(delete_file_from_imagekit(video_url_to_delete))
-
-    if delete_tasks:
-        await asyncio.gather(*delete_tasks)
+    # Now that the post is deleted from the DB, delete its files from
+    # ImageKit in the background.
+    _delete_in_background(image_to_delete, video_to_delete)
 
     return None
 
@@ -189,14 +259,7 @@ async def get_comments_for_post(
     """
     Get all comments for a specific post. Public endpoint.
     """
-    # First, check if the post exists to return a clear 404
-    post_result = await session.execute(select(Post).where(Post.id == post_id))
-    if post_result.scalar_one_or_none() is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
-        )
-
-    # Now, get all comments for that post, eagerly loading the owner
+    # Get all comments for the post, eagerly loading the owner
     query = (
         select(Comment)
         .where(Comment.post_id == post_id)
@@ -207,6 +270,15 @@ async def get_comments_for_post(
     result = await session.execute(query)
     comments = result.scalars().all()
 
+    # Only pay for the existence probe on the empty case; any comment
+    # already proves the post exists, saving a round-trip.
+    if not comments:
+        post_exists = await session.scalar(select(Post.id).where(Post.id == post_id))
+        if post_exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
+            )
+
     return comments
 
 
@@ -226,24 +298,32 @@ async def create_comment_for_post(
     """
     Create a new comment. The user must be authenticated AND VERIFIED.
     """
-    # Check if post exists (you already had this, which is great)
-    post_result = await session.execute(select(Post).where(Post.id == post_id))
-    if post_result.scalar_one_or_none() is None:
+    # Single round-trip: INSERT ... RETURNING gives us the row with its
+    # server-side timestamps, and the post_id foreign key already
+    # enforces that the post exists — no separate existence check or
+    # post-commit reload needed.
+    stmt = (
+        insert(Comment)
+        .values(**comment.model_dump(), owner_id=user.id, post_id=post_id)
+        .returning(Comment)
+    )
+    try:
+        result = await session.execute(select(Comment).from_statement(stmt))
+        new_comment = result.scalar_one()
+    except IntegrityError:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
         )
-
-    new_comment = Comment(**comment.model_dump(), owner_id=user.id, post_id=post_id)
-    session.add(new_comment)
     await session.commit()
-    await session.refresh(new_comment)
-
-    # We need to refresh the comment AND its relationships to return them
-    result = await session.execute(
-        select(Comment)
-        .where(Comment.id == new_comment.id)
-        .options(selectinload(Comment.owner))
-    )
-    new_comment_with_owner = result.scalar_one()
 
-    return new_comment_with_owner
+    # The owner is the requesting user, already in scope — no reload.
+    return {
+        "id": new_comment.id,
+        "content": new_comment.content,
+        "owner_id": user.id,
+        "post_id": post_id,
+        "created_at": new_comment.created_at,
+        "updated_at": new_comment.updated_at,
+        "owner": user,
+    }
@@ -103,6 +103,9 @@ class PostBase(BaseModel):
     content: str | None = None
     image_url: str | None = None
     video_url: str | None = None
+    # ImageKit file IDs from the client-side upload, used for O(1) deletes
+    image_file_id: str | None = None
+    video_file_id: str | None = None
 
 
 class PostCreate(PostBase):
@@ -121,6 +124,8 @@ class PostUpdate(BaseModel):
     content: str | None = None
     image_url: str | None = None
     video_url: str | None = None
+    image_file_id: str | None = None
+    video_file_id: str | None = None
 
 
 class PostRead(PostBase):
@@ -135,6 +140,17 @@ class PostRead(PostBase):
         from_attributes = True
 
 
+class PostPage(BaseModel):
+    """
+    One keyset-paginated page of posts, plus the cursor for the next
+    page (null when this is the last page).
+    """
+
+    items: List[PostRead]
+    next_after: datetime | None = None
+    next_after_id: int | None = None
+
+
 class PostReadWithDetails(PostRead):
     """
     Schema for reading a single post with all details:
@@ -1,5 +1,7 @@
 # app/uploads.py
 import time
+import uuid
+from collections import OrderedDict
 
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -10,6 +12,14 @@ from .models import User
 
 router = APIRouter(prefix="/uploads", tags=["Uploads"])
 
+# Auth params are valid for 60 seconds, so serving the same set to a user
+# for 45 of them is safe and skips the HMAC signing on repeat requests
+# (e.g. an image and a video upload back to back). Keyed by user id, LRU
+# evicted, same shape as the token cache in auth.py.
+_AUTH_CACHE_TTL = 45
+_AUTH_CACHE_MAX = 10_000
+_auth_cache: OrderedDict[uuid.UUID, tuple[float, dict]] = OrderedDict()
+
 
 @router.get("/auth")
 async def get_imagekit_auth(user: User = Depends(current_active_verified_user)):
@@ -25,11 +35,24 @@ async def get_imagekit_auth(user: User = Depends(current_active_verified_user)):
             status_code=500, detail="File upload service is not configured."
         )
 
+    now = time.time()
+    cached = _auth_cache.get(user.id)
+    if cached is not None:
+        generated_at, params = cached
+        if now - generated_at < _AUTH_CACHE_TTL:
+            return params
+        del _auth_cache[user.id]
+
     # Generate a unique token, expiring in 60 seconds
     # This prevents users from just holding on to tokens.
     params = imagekit.get_authentication_parameters(
-        token=f"{user.id}_{int(time.time())}", expire=60
+        token=f"{user.id}_{int(now)}", expire=60
     )
 
+    _auth_cache[user.id] = (now, params)
+    _auth_cache.move_to_end(user.id)
+    while len(_auth_cache) > _AUTH_CACHE_MAX:
+        _auth_cache.popitem(last=False)
+
     logger.info(f"Generated ImageKit auth token for user {user.email}")
     return params
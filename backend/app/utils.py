@@ -1,4 +1,5 @@
 # app/utils.py
+import asyncio
 from urllib.parse import urlparse
 
 from fastapi import UploadFile
@@ -7,6 +8,10 @@ from .config import get_settings  # 👈 1. ADD THIS IMPORT
 from .imagekit_client import imagekit
 from .logging_config import logger
 
+# Bound once at import, like the other modules; settings never change
+# at runtime and delete is the hottest path in this file.
+settings = get_settings()
+
 
 # This function is NO LONGER USED in Path A for creating posts,
 # but it's fine to leave it for future reference.
@@ -28,7 +33,10 @@ async def upload_file_to_imagekit(
     try:
         logger.info(f"Uploading file '{file_name}' to ImageKit folder '{folder}'...")
 
-        upload_result = imagekit.upload(
+        # The imagekitio SDK is synchronous; run it in a thread so the
+        # HTTPS round-trip doesn't block the event loop.
+        upload_result = await asyncio.to_thread(
+            imagekit.upload,
             file=file_bytes,
             file_name=file_name,
             options={
@@ -46,15 +54,29 @@ async def upload_file_to_imagekit(
 
 
 # 👇 THIS IS THE UPDATED FUNCTION
-async def delete_file_from_imagekit(file_url: str):
+async def delete_file_from_imagekit(file_url: str | None, file_id: str | None = None):
     """
-    Deletes a file from ImageKit using its full URL.
+    Deletes a file from ImageKit, preferably by its stored file_id
+    (one API call); falls back to a lookup by URL for rows that
+    predate the file_id columns.
     """
-    settings = get_settings()
+    if imagekit is None:
+        logger.warning("ImageKit client not init.")
+        return
+
+    # Fast path: the post stored the file_id at upload time, so no
+    # list_files search is needed.
+    if file_id:
+        try:
+            await asyncio.to_thread(imagekit.delete_file, file_id=file_id)
+            logger.success(f"Successfully deleted file {file_id} from ImageKit.")
+        except Exception as e:
+            logger.error(f"Error deleting file {file_id} from ImageKit: {e}")
+        return
 
     # --- 👇 2. ADD THIS VALIDATION BLOCK ---
-    if not file_url or imagekit is None:
-        logger.warning("No file URL provided or ImageKit client not init.")
+    if not file_url:
+        logger.warning("No file URL provided.")
         return
 
     # Check if it's a real ImageKit URL before trying to delete
@@ -70,16 +92,16 @@ async def delete_file_from_imagekit(file_url: str):
         # e.g., "https://ik.imagekit.io/your_id/post_images/file.jpg"
         path = urlparse(file_url).path
 
-        # 2. Search for the file by its path
+        # 2. Search for the file by its path (sync SDK, so in a thread)
         logger.info(f"Attempting to find file with path: {path}")
-        file_list = imagekit.list_files({"path": path})
+        file_list = await asyncio.to_thread(imagekit.list_files, {"path": path})
 
         if file_list.list:
             file_id = file_list.list[0].file_id
             logger.info(f"Found file_id: {file_id}. Deleting...")
 
             # 3. Delete the file using its unique ID
-            imagekit.delete_file(file_id=file_id)
+            await asyncio.to_thread(imagekit.delete_file, file_id=file_id)
             logger.success(f"Successfully deleted file {file_id} from ImageKit.")
         else:
             logger.warning(f"Could not find file at path {path} in ImageKit to delete.")